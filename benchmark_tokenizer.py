@@ -0,0 +1,81 @@
+""" Benchmark for NameSwap's cell tokenizer, comparing CSVProcessor._apply_renaming against the original character loop.
+    Checks that both produce identical output with default settings, then times each over the same randomly generated cells.
+
+    Usage: python3 benchmark_tokenizer.py [cell_count] [seed]
+"""
+
+import sys
+import random
+import timeit
+from nameswap import Configuration, CSVProcessor, Renamer
+
+# Characters used to build random cells. Includes every default splitting character, so repeated and trailing delimiters are covered
+CELL_ALPHABET = "abcdeJMS. -–—,"
+
+def legacy_apply_renaming(renamer:Renamer, name_string:str):
+    """ Original tokenizer from before splitting characters were configurable, kept as the reference implementation."""
+    splitting_characters = [' ','-','–','—',',']
+
+    built_string = ""
+    pending_chars = ""
+    for c in name_string:
+        if c in splitting_characters:
+            built_string += renamer.get_safe_name(pending_chars)
+            built_string += c
+            pending_chars = ""
+        else:
+            pending_chars+=c
+
+    if pending_chars != "":
+        built_string += renamer.get_safe_name(pending_chars)
+
+    return built_string
+
+def build_processor(exempt_tokens:bool):
+    """ Assemble a CSVProcessor with default tokenization settings, bypassing argument processing and file validation."""
+    config = Configuration()
+    config.selected_prefix = config.default_prefix
+    config.exempt_name_tokens = exempt_tokens
+    config._apply_remaining_defaults()
+    return CSVProcessor(config, Renamer("benchmark"))
+
+def build_cells(count:int, seed:int):
+    """ Generate a mix of realistic name cells and random strings drawn from CELL_ALPHABET."""
+    rng = random.Random(seed)
+    cells = []
+    for i in range(count):
+        if i % 2:
+            cells.append(f"{rng.choice(['Dr. ', ''])}First{rng.randrange(500)} {rng.choice(['van ', ''])}Last{rng.randrange(500)}-Other{rng.randrange(50)}, Jr.")
+        else:
+            cells.append("".join(rng.choice(CELL_ALPHABET) for _ in range(rng.randrange(1, 30))))
+    return cells
+
+if __name__ == "__main__":
+    """ Run the equivalence check, then print timings for each tokenizer."""
+
+    cell_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    cells = build_cells(cell_count, seed)
+
+    for exempt_tokens in (False, True):
+        processor = build_processor(exempt_tokens)
+        renamer = processor.renamer
+
+        # Warm the mapping cache so timings measure tokenizing rather than name generation
+        for cell in cells:
+            legacy_apply_renaming(renamer, cell)
+
+        # With exemption off, both tokenizers must agree exactly
+        if not exempt_tokens:
+            mismatches = [cell for cell in cells if processor._apply_renaming(cell) != legacy_apply_renaming(renamer, cell)]
+            if mismatches:
+                print(f"Output mismatch on {len(mismatches)} cells, e.g. {mismatches[0]!r}")
+                sys.exit(1)
+            print(f"Output matches legacy tokenizer on {cell_count} cells")
+
+        for cell in cells:
+            processor._apply_renaming(cell)
+
+        current_time = min(timeit.repeat(lambda: [processor._apply_renaming(cell) for cell in cells], number=5, repeat=5))
+        legacy_time = min(timeit.repeat(lambda: [legacy_apply_renaming(renamer, cell) for cell in cells], number=5, repeat=5))
+        print(f"exempt_tokens={exempt_tokens}: current {current_time:0.3f}s | legacy {legacy_time:0.3f}s | ratio {current_time / legacy_time:0.2f}")
@@ -9,6 +9,7 @@ import csv
 import random
 import json
 import os
+import re
 from typing import Dict,Set,TextIO
 from textwrap import dedent
 from faker import Faker
@@ -36,6 +37,8 @@ MENU_TEXT = dedent("""
         [-p <prefix>] - optionally specify the prefix for renamed files. defaults to 'renamed-')
         [-s <seed>]   - optionally specify a seed for deterministic mappings. (same inputs with same seed yield same outputs)
         [-m <mappingfile>] - optionally specify a path to a mapping session file to load and/or save mappings across sessions. (should be .json format)
+        [-d <characters>]  - optionally specify the characters that split a cell into name parts. (defaults to spaces, hyphens, dashes and commas)
+        [-x <token>]       - optionally exempt an extra token from renaming, such as an uncommon title. (implies --exempttokens, unless --noexempttokens is given)
 
     Option flags:
         [--help]             - display basic help information
@@ -44,10 +47,22 @@ MENU_TEXT = dedent("""
         [--defaultcolumns]   - apply default columns if none were specified
         [--renamewholecells] - apply renaming to entire cells, instead of splitting by spaces and commas. (use with caution)
         [--warnmaxattempts]  - warn if max attempts to generate unique names is reached (may indicate high name collision rate)
+        [--exempttokens]     - leave common titles, particles and suffixes ("Dr", "van", "Jr.") unchanged instead of renaming them
+        [--noexempttokens]   - rename all name parts, overriding -x, --exempttokens and mapping file settings
 
         see documentation for more details on each flag and option, especially -s and --renamewholecells
 """)
 
+# Characters that separate name parts within a cell, unless overridden with -d
+DEFAULT_SPLITTING_CHARACTERS = " -–—,"
+
+# Name parts left unchanged when --exempttokens is enabled. Compared in lowercase with all periods removed ("Jr." matches "jr", "Ph.D." matches "phd")
+EXEMPT_NAME_TOKENS = frozenset({
+    "mr", "mrs", "ms", "miss", "mx", "dr", "prof", "rev", "sir",    #Honorifics
+    "de", "del", "della", "der", "di", "da", "du", "van", "von",    #Particles
+    "jr", "sr", "ii", "iii", "iv", "esq", "phd", "md",              #Suffixes
+})
+
 class SessionManager:
     """Provide a save/load layer for continuous use of a mapping set across sessions."""
     
@@ -58,7 +73,10 @@ class SessionManager:
             "config": {
                 "seed" : renamer.seed,
                 #"max_attempts" : renamer.max_attempts,# Since this isn't modifiable by the user yet, I dont think saving it is neccessary. if it becomes modifiable, it should absolutely be saved here
-                "rename_whole_cells" : config.rename_whole_cells
+                "rename_whole_cells" : config.rename_whole_cells,
+                "splitting_characters" : config.splitting_characters,
+                "exempt_tokens" : config.exempt_name_tokens,
+                "extra_exempt_tokens" : sorted(config.extra_exempt_tokens)
             },
             "mappings" : renamer.mappings
         }
@@ -193,6 +211,8 @@ class Configuration:
         self.columns = set()
         self.selected_prefix = None
         self.selected_seed = None
+        self.splitting_characters = None
+        self.extra_exempt_tokens = set()
         
         #Loaded session data, when applicable
         self.loaded_mappings = None
@@ -203,6 +223,7 @@ class Configuration:
         self.auto_detect_columns = False
         self.rename_whole_cells = False  #Applies renaming function to whole cells. For formats with multiple names in a cell ("First Last", "Last, First" "Hyphen-ated") this can lead to inconsistent outputs, and should be applied with caution
         self.warn_max_attempts = False
+        self.exempt_name_tokens = None #Leaves titles, particles and suffixes unchanged while tokenizing. Sentinel until resolved by user input, session data, or default (off, as exempted tokens may expose unique name formats)
         self.applied_default_columns = False #Toggled for accurate print confirmation of what happens during config
         
         self.mapping_path = None
@@ -219,6 +240,9 @@ class Configuration:
             "-p" : lambda x: setattr(self, 'selected_prefix', x),   #Set selected prefix for output files
             "-s" : lambda x: setattr(self, 'selected_seed', x),     #Set selected seed for deterministic generation (defaults to true random)
             "-m" : lambda x: setattr(self, 'mapping_path',x),        #Set path for loading/saving mapping sessions
+            "-d" : lambda x: setattr(self, 'splitting_characters', x), #Set characters that split cells into name parts
+            "-x" : lambda x: (self.extra_exempt_tokens.add(self._normalize_exempt_token(x)),
+                              self._enable_exempt_tokens()),        #Add token to leave unchanged, enabling token exemption unless --noexempttokens was given
         }
             
         # Map command-line options to lambda functions that handle their actions
@@ -230,7 +254,9 @@ class Configuration:
                                            setattr(self,'applied_default_columns',True)),      #Update selected columns to include defaults, set boolean for accurate reporting.
             "--renamewholecells" : lambda : setattr(self, 'rename_whole_cells', True),         #Set boolean to rename whole cells, rather than tokenizing
             "--warnmaxattempts" : lambda : setattr(self, 'warn_max_attempts', True),           #Set boolean to notify user when renaming attempts max out and numbers are added
-            "--autocolumns" : lambda : setattr(self, 'auto_detect_columns', True)              #Set boolean to auto-detect name columns
+            "--autocolumns" : lambda : setattr(self, 'auto_detect_columns', True),             #Set boolean to auto-detect name columns
+            "--exempttokens" : lambda : self._enable_exempt_tokens(),                        #Set boolean to leave titles, particles and suffixes unchanged, unless --noexempttokens was given
+            "--noexempttokens" : lambda : setattr(self, 'exempt_name_tokens', False)           #Set boolean to rename all name parts, overriding -x, --exempttokens and session data
         }
         
     def _autostop_warning(self,flag:str):
@@ -239,6 +265,16 @@ class Configuration:
             plural = "s were" if extras != 1 else " was"
             print(f"Note: {extras} extra argument{plural} found, but {flag} stops execution.\nTo continue, remove {flag} from your command and rerun.")
 
+    @staticmethod
+    def _normalize_exempt_token(token:str):
+        """ Normalize a token for comparison against exempt tokens, matching the check in CSVProcessor._apply_renaming."""
+        return token.strip().lower().replace('.', '')
+
+    def _enable_exempt_tokens(self):
+        """ Enable token exemption unless already disabled. --noexempttokens takes precedence regardless of flag order, so no name part is left unrenamed by accident."""
+        if self.exempt_name_tokens is None:
+            self.exempt_name_tokens = True
+
     def process_args(self,arg_queue:list):
         """ Processes command-line arguments sequentially to configure the application.
             Args: arg_queue (list): list of command-line arguments to process
@@ -338,6 +374,35 @@ class Configuration:
                 if not self.rename_whole_cells:
                     self.rename_whole_cells = config_json["rename_whole_cells"]
                     print(f"Applied rename_whole_cells from session data: {self.rename_whole_cells}")
+
+            #Tokenization settings change which name parts are mapped, so user overrides are reported like the seed above
+            if "splitting_characters" in config_json:
+                loaded_characters = config_json["splitting_characters"]
+                if self.splitting_characters is None:
+                    self.splitting_characters = loaded_characters
+                    print(f"Applied splitting characters from session data: {self.splitting_characters!r}")
+                elif self.splitting_characters != loaded_characters:
+                    print(f"Splitting characters were set by user input ({self.splitting_characters!r}), overriding loaded splitting characters ({loaded_characters!r}). Mappings may not match earlier sessions. To use the loaded value, remove '-d' and rerun")
+
+            if "exempt_tokens" in config_json:
+                loaded_exempt = config_json["exempt_tokens"]
+                if self.exempt_name_tokens is None:
+                    self.exempt_name_tokens = loaded_exempt
+                    print(f"Applied exempt_tokens from session data: {self.exempt_name_tokens}")
+                elif self.exempt_name_tokens != loaded_exempt:
+                    print(f"exempt_tokens was set by user input ({self.exempt_name_tokens}), overriding loaded exempt_tokens ({loaded_exempt}). Mappings may not match earlier sessions. To use the loaded value, remove '--exempttokens', '--noexempttokens' and '-x' and rerun")
+
+            if "extra_exempt_tokens" in config_json:
+                loaded_list = config_json["extra_exempt_tokens"]
+                if not isinstance(loaded_list, list) or not all(isinstance(token, str) for token in loaded_list):
+                    raise ValueError(f"Invalid extra_exempt_tokens in mapping file {self.mapping_path}: expected a list of strings. \nExiting.")
+                loaded_tokens = {self._normalize_exempt_token(token) for token in loaded_list}
+                if not self.extra_exempt_tokens:
+                    self.extra_exempt_tokens = loaded_tokens
+                    if loaded_tokens:
+                        print(f"Applied extra exempt tokens from session data: {sorted(loaded_tokens)}")
+                elif self.extra_exempt_tokens != loaded_tokens:
+                    print(f"Extra exempt tokens were set by user input ({sorted(self.extra_exempt_tokens)}), overriding loaded extra exempt tokens ({sorted(loaded_tokens)}). Mappings may not match earlier sessions. To use the loaded tokens, remove '-x' and rerun")
                     
             #FUTURE - other saved config options would go here
             
@@ -407,6 +472,14 @@ class Configuration:
             print(f"No prefix specified, applying default prefix '{self.default_prefix}'.")
             self.selected_prefix = self.default_prefix
 
+        #Apply default splitting characters if not specified. An empty string can't split anything, so it's treated the same way
+        if not self.splitting_characters:
+            self.splitting_characters = DEFAULT_SPLITTING_CHARACTERS
+
+        #Leave token exemption off if neither user input nor session data enabled it
+        if self.exempt_name_tokens is None:
+            self.exempt_name_tokens = False
+
     def validate_config(self):
         """ Ensure minimum required inputs are present and ready to use, returning boolean indicating validity."""
         
@@ -432,6 +505,12 @@ class Configuration:
             print(f"Seed: {self.selected_seed}")
         if self.mapping_path:
             print(f"Mapping file: {self.mapping_path}")
+        if self.splitting_characters != DEFAULT_SPLITTING_CHARACTERS and not self.rename_whole_cells:
+            print(f"Splitting characters: {self.splitting_characters!r}")
+        if self.exempt_name_tokens and not self.rename_whole_cells:
+            print(f"Exempt tokens: {sorted(EXEMPT_NAME_TOKENS | self.extra_exempt_tokens)}")
+        elif self.extra_exempt_tokens and not self.rename_whole_cells:
+            print(f"Exempt tokens: none. Token exemption is off, so extra exempt tokens {sorted(self.extra_exempt_tokens)} are ignored and renamed")
         print()
 
     def user_confirm(self):
@@ -467,8 +546,12 @@ class CSVProcessor:
         #Store key values and settings
         self.target_files = self.config.files
         self.given_prefix = self.config.selected_prefix
-        self.lowercase_columns = {col.lower(): col for col in config.columns} #store columns in lowercase for standardized comparison
-        self.rename_whole_cells = config.rename_whole_cells
+        self.lowercase_columns = {col.lower(): col for col in self.config.columns} #store columns in lowercase for standardized comparison
+        self.rename_whole_cells = self.config.rename_whole_cells
+
+        #Precompile tokenizer once, rather than per cell. The capturing group keeps delimiters in the split output, so they can be rejoined unchanged
+        self.splitting_pattern = re.compile(f"([{re.escape(self.config.splitting_characters)}])")
+        self.exempt_tokens = (EXEMPT_NAME_TOKENS | self.config.extra_exempt_tokens) if self.config.exempt_name_tokens else frozenset()
     
     def start_processing(self):
         """ Iterates through input files and applies processes each individually, logging each result to console."""
@@ -591,29 +674,26 @@ class CSVProcessor:
             return self.renamer.get_safe_name(name_string)
 
         else:
-            #splitting_strings = ["jr","sr",del] #FUTURE - also exempt strings like titles and connecting words? # Not needed for my use case and may expose unique name formats
-            splitting_characters = [' ','-','–','—',',']
-
-            built_string = ""
-            pending_chars = ""
-
-            #Iterate through characters in string, pausing to rename and append recent characters whenever a splitting character is reached.
-            for c in name_string:
-                if c in splitting_characters:
-                    renamed_string = self.renamer.get_safe_name(pending_chars)
-
-                    #append renamed string and splitting token, then clear pendingChars
-                    built_string += renamed_string
-                    built_string += c
-                    pending_chars = ""
-                else:
-                    pending_chars+=c
-            
-            #if a remainder exists, rename and append
-            if pending_chars != "":
-                built_string += self.renamer.get_safe_name(pending_chars)
-
-            return built_string
+            #Split into alternating name parts and delimiters. Even indices hold name parts (possibly empty), odd indices hold the delimiters between them
+            tokens = self.splitting_pattern.split(name_string)
+            exempt_tokens = self.exempt_tokens
+
+            #Rename each name part in place, leaving delimiters and exempt tokens unchanged. Skips the set lookup entirely when exemption is off
+            for i in range(0, len(tokens), 2):
+                token = tokens[i]
+                name_part = token.strip()
+                #Exemption check inlines Configuration._normalize_exempt_token to avoid a call per name part
+                if not name_part or (exempt_tokens and name_part.lower().replace('.', '') in exempt_tokens):
+                    continue
+                renamed_part = self.renamer.get_safe_name(name_part)
+
+                #Keep whitespace around the name part (e.g. "Smith, John" with -d ","), since the renamer only maps the stripped name
+                if len(name_part) != len(token):
+                    start = token.find(name_part)
+                    renamed_part = token[:start] + renamed_part + token[start + len(name_part):]
+                tokens[i] = renamed_part
+
+            return "".join(tokens)
 
 if __name__ == "__main__":
     """ Main execution block for the NameSwap application. Sets up configuration, processes files, and logs results to terminal."""